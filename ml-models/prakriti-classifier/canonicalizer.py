@@ -0,0 +1,235 @@
+"""
+Prakriti Classifier - Category Canonicalization
+================================================
+Map free-form answer strings onto the category values each feature was
+trained on, so case/whitespace/punctuation variants such as
+"Black/Brown, dull" vs "Black/Brown,dull" are not treated as unseen.
+
+Lookup order per value:
+    1. exact       - value is a known category
+    2. normalized  - same key after lowercasing and collapsing punctuation/whitespace
+    3. fuzzy       - a single clear near miss:
+                       * single-word vocabularies (e.g. Stress Levels): a typo
+                         within a small edit distance of one category
+                       * otherwise: best character-trigram (Dice) score above a
+                         threshold, every input word covered by the category
+                         and the same negation ("not"/"no"/"non")
+    4. ambiguous   - near misses exist but none beats the runner-up by a margin
+    5. unseen      - nothing close enough
+
+Results are memoized per feature. The cache only lives as long as the
+index, so it pays off in long-running processes; predict.py's CLI builds a
+fresh index for every request.
+"""
+
+import re
+from collections import defaultdict
+
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+DEFAULT_MIN_SCORE = 0.6
+DEFAULT_MIN_MARGIN = 0.1
+DEFAULT_CACHE_SIZE = 4096
+
+NEGATIONS = frozenset({'not', 'no', 'non'})
+
+# Filler words that don't need to appear in the matched category
+FILLER_WORDS = frozenset({'a', 'an', 'and', 'the', 'of', 'or', 'with', 'to', 'in', 'is', 'are', 'my'})
+
+
+def normalize_key(value):
+    """Lowercase and collapse every run of punctuation/whitespace to one space"""
+    return _NON_ALNUM.sub(' ', str(value).lower()).strip()
+
+
+def char_ngrams(key, n=3):
+    """Set of padded character n-grams of a normalized key"""
+    padded = f' {key} '
+    if len(padded) < n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance between two strings"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+def max_typos(word):
+    """Edits tolerated for a word: none for short words, more for long ones"""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+class FeatureVocabularyIndex:
+    """Canonicalization index for one feature's category vocabulary"""
+
+    def __init__(self, vocabulary, min_score=DEFAULT_MIN_SCORE,
+                 min_margin=DEFAULT_MIN_MARGIN, cache_size=DEFAULT_CACHE_SIZE):
+        self.vocabulary = [str(v) for v in vocabulary]
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.cache_size = cache_size
+        self._cache = {}
+
+        self._exact = {value: idx for idx, value in enumerate(self.vocabulary)}
+
+        keys = [normalize_key(value) for value in self.vocabulary]
+        self._keys = keys
+
+        # Normalized key -> first category with that key
+        self._normalized = {}
+        for idx, key in enumerate(keys):
+            self._normalized.setdefault(key, idx)
+
+        # Words of every category, for coverage and negation checks
+        self._words = [set(key.split()) for key in keys]
+        self._single_word = all(len(words) == 1 for words in self._words)
+
+        # Precomputed n-gram inverted index over the normalized keys
+        self._ngram_sizes = []
+        self._postings = defaultdict(list)
+        for idx, key in enumerate(keys):
+            grams = char_ngrams(key)
+            self._ngram_sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(idx)
+
+    def lookup(self, value):
+        """
+        Canonicalize a raw value
+
+        Returns:
+            tuple: (category index or None, match type, score)
+        """
+        value = str(value)
+        cached = self._cache.get(value)
+        if cached is not None:
+            return cached
+
+        result = self._match(value)
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[value] = result
+        return result
+
+    def _match(self, value):
+        if value in self._exact:
+            return self._exact[value], 'exact', 1.0
+
+        key = normalize_key(value)
+        if key in self._normalized:
+            return self._normalized[key], 'normalized', 1.0
+
+        if self._single_word:
+            return self._match_typo(key)
+        return self._match_ngrams(key)
+
+    def _match_typo(self, key):
+        """Single-word vocabularies: accept only a typo of one category"""
+        if ' ' in key or not key:
+            return None, 'unseen', 0.0
+
+        distances = sorted(
+            (edit_distance(key, self._keys[idx]), idx)
+            for idx in range(len(self.vocabulary))
+        )
+        best_distance, best_idx = distances[0]
+        score = 1.0 - best_distance / max(len(key), len(self._keys[best_idx]))
+
+        if best_distance > max_typos(key):
+            return None, 'unseen', score
+        if len(distances) > 1 and distances[1][0] == best_distance:
+            return None, 'ambiguous', score
+        return best_idx, 'fuzzy', score
+
+    def _match_ngrams(self, key):
+        """Multi-word vocabularies: n-gram similarity with word coverage"""
+        grams = char_ngrams(key)
+        shared = defaultdict(int)
+        for gram in grams:
+            for idx in self._postings.get(gram, ()):
+                shared[idx] += 1
+
+        words = set(key.split())
+        negations = words & NEGATIONS
+        content_words = words - NEGATIONS - FILLER_WORDS
+
+        candidates = []
+        for idx, overlap in shared.items():
+            score = 2.0 * overlap / (len(grams) + self._ngram_sizes[idx])
+            if self._words[idx] & NEGATIONS != negations:
+                continue
+            if not all(self._covers(idx, word) for word in content_words):
+                continue
+            candidates.append((score, idx))
+
+        if not candidates:
+            return None, 'unseen', max(
+                (2.0 * overlap / (len(grams) + self._ngram_sizes[idx])
+                 for idx, overlap in shared.items()),
+                default=0.0
+            )
+
+        candidates.sort(reverse=True)
+        best_score, best_idx = candidates[0]
+        if best_score < self.min_score:
+            return None, 'unseen', best_score
+        if len(candidates) > 1 and best_score - candidates[1][0] < self.min_margin:
+            return None, 'ambiguous', best_score
+        return best_idx, 'fuzzy', best_score
+
+    def _covers(self, idx, word):
+        """Whether a category contains `word` (allowing small typos)"""
+        category_words = self._words[idx]
+        if word in category_words:
+            return True
+        limit = max_typos(word)
+        return limit > 0 and any(
+            edit_distance(word, other) <= limit for other in category_words
+        )
+
+
+class CategoryCanonicalizer:
+    """Per-feature canonicalization indexes built from fitted LabelEncoders"""
+
+    def __init__(self, feature_encoders, min_score=DEFAULT_MIN_SCORE):
+        self.indexes = {
+            feature: FeatureVocabularyIndex(encoder.classes_, min_score=min_score)
+            for feature, encoder in feature_encoders.items()
+        }
+
+    def canonicalize(self, feature, value):
+        """
+        Canonicalize one feature value
+
+        Returns:
+            dict: {'input', 'value', 'code', 'match', 'score'} where `code` is
+            the LabelEncoder code (None when unseen or ambiguous)
+        """
+        index = self.indexes[feature]
+        code, match, score = index.lookup(value)
+        return {
+            'input': value,
+            'value': index.vocabulary[code] if code is not None else None,
+            'code': code,
+            'match': match,
+            'score': round(float(score), 4)
+        }
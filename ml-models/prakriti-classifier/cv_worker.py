@@ -0,0 +1,46 @@
+"""
+Prakriti Classifier - Cross-Validation Worker
+==============================================
+Task functions run in the cross-validation process pool.
+
+They live in their own importable module rather than in train_model.py:
+functions defined in __main__ are pickled by value for every task, which
+gives each task a fresh globals dict and defeats the per-process fold
+cache below.
+"""
+
+import time
+
+import joblib
+from sklearn.metrics import accuracy_score, f1_score
+
+# Workers don't inherit train_model.py's warning filters
+import warnings
+warnings.filterwarnings('ignore')
+
+
+# Fold arrays memory-mapped by each worker process, keyed by file path
+_FOLD_CACHE = {}
+
+
+def load_folds(folds_path):
+    """Memory-map the cached fold arrays once per worker process"""
+    if folds_path not in _FOLD_CACHE:
+        _FOLD_CACHE.clear()
+        _FOLD_CACHE[folds_path] = joblib.load(folds_path, mmap_mode='r')
+    return _FOLD_CACHE[folds_path]
+
+
+def fit_and_score_fold(name, model, fold_id, folds_path):
+    """Fit one candidate model on one cached CV fold"""
+    start = time.perf_counter()
+    X_train, X_test, y_train, y_test = load_folds(folds_path)[fold_id]
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    return {
+        'model': name,
+        'fold': fold_id,
+        'accuracy': accuracy_score(y_test, y_pred),
+        'f1_score': f1_score(y_test, y_pred, average='weighted'),
+        'seconds': time.perf_counter() - start
+    }
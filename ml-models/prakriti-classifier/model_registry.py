@@ -0,0 +1,466 @@
+"""
+Prakriti Classifier - Model Registry
+=====================================
+Content-addressed storage for trained model artifacts.
+
+Each artifact (model, label encoder, feature encoders) is pickled, hashed
+(SHA-256) and stored once, gzip-compressed, under objects/. A small
+index.json records every version with its metrics, latency benchmark,
+dataset hash and artifact hashes. Aliases such as 'latest' and
+'production' are plain pointers to a version id.
+
+Every change to index.json, and garbage collection of objects, happens
+under an exclusive lock on registry/.lock, so concurrent trainings,
+promotions and prunes don't lose each other's updates.
+
+Layout:
+    models/registry/
+        index.json
+        .lock
+        objects/<sha256>.pkl.gz
+
+Usage:
+    python model_registry.py list
+    python model_registry.py promote <version> [--alias production]
+    python model_registry.py prune [--keep 10] [--max-mb 50]
+    python model_registry.py import-legacy [--alias production]
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import pickle
+import hashlib
+import argparse
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+ARTIFACT_NAMES = ('model', 'label_encoder', 'feature_encoders')
+DEFAULT_KEEP_VERSIONS = 10
+
+# Version ids are training timestamps, optionally suffixed (_2, _3, ...)
+# when several trainings start in the same second
+_VERSION_PATTERN = re.compile(r'^(\d{8}_\d{6})(?:_(\d+))?$')
+
+
+def version_sort_key(version):
+    """Chronological sort key for version ids ('..._10' sorts after '..._9')"""
+    match = _VERSION_PATTERN.match(version)
+    if match is None:
+        return (version, 0)
+    return (match.group(1), int(match.group(2) or 1))
+
+
+def hash_file(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents (used for dataset hashes)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write(path, data):
+    """Write bytes to path via a temp file so readers never see partial files"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ModelRegistry:
+    """Content-addressed, deduplicated store of model versions"""
+
+    def __init__(self, registry_dir=None):
+        if registry_dir is None:
+            registry_dir = Path(__file__).parent / 'models' / 'registry'
+        self.registry_dir = Path(registry_dir)
+        self.objects_dir = self.registry_dir / 'objects'
+        self.index_path = self.registry_dir / 'index.json'
+        self.lock_path = self.registry_dir / '.lock'
+        self._object_cache = {}
+        self._lock_depth = 0
+
+    def exists(self):
+        """Whether a registry index has been created"""
+        return self.index_path.exists()
+
+    @contextmanager
+    def lock(self):
+        """Exclusive, re-entrant lock for index read-modify-write and GC"""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield self
+            finally:
+                self._lock_depth -= 1
+            return
+
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after ~10s; keep waiting
+                        continue
+            self._lock_depth = 1
+            try:
+                yield self
+            finally:
+                self._lock_depth = 0
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def load_index(self):
+        """Load index.json (empty index if the registry is new)"""
+        if not self.index_path.exists():
+            return {'versions': {}, 'aliases': {}}
+        with open(self.index_path, 'r') as f:
+            return json.load(f)
+
+    def _save_index(self, index):
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.index_path, json.dumps(index, indent=2).encode('utf-8'))
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+    def _object_path(self, digest):
+        return self.objects_dir / f'{digest}.pkl.gz'
+
+    def put_object(self, obj):
+        """Store an object once by content hash; returns the hash"""
+        payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.sha256(payload).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(object_path, gzip.compress(payload, compresslevel=6))
+        return digest
+
+    def get_object(self, digest):
+        """Load an object by hash (cached - objects are immutable)"""
+        if digest not in self._object_cache:
+            with gzip.open(self._object_path(digest), 'rb') as f:
+                self._object_cache[digest] = pickle.load(f)
+        return self._object_cache[digest]
+
+    # ------------------------------------------------------------------
+    # Versions & aliases
+    # ------------------------------------------------------------------
+    def register(self, version, artifacts, metadata, aliases=('latest',)):
+        """
+        Store a new model version
+
+        Args:
+            version (str): Version id (training timestamp)
+            artifacts (dict): {'model': ..., 'label_encoder': ..., 'feature_encoders': ...}
+            metadata (dict): Metrics, latency benchmark, dataset hash, etc.
+            aliases (iterable): Aliases to point at this version
+
+        Returns:
+            dict: The index entry for the version
+        """
+        missing = [name for name in ARTIFACT_NAMES if name not in artifacts]
+        if missing:
+            raise ValueError(f"Missing artifacts: {', '.join(missing)}")
+
+        # Objects are written under the lock too, so a concurrent prune can't
+        # collect them before the index references them
+        with self.lock():
+            index = self.load_index()
+            if version in index['versions']:
+                raise ValueError(f"Model version already registered: {version}")
+            if 'latest' in aliases and not self._is_newest(index, version):
+                raise ValueError(f"Refusing to move 'latest' onto older version: {version}")
+
+            hashes = {name: self.put_object(artifacts[name]) for name in ARTIFACT_NAMES}
+
+            entry = {
+                'version': version,
+                'registered_at': datetime.now().isoformat(),
+                'artifacts': hashes,
+                'metadata': metadata
+            }
+            index['versions'][version] = entry
+            for alias in aliases:
+                index['aliases'][alias] = version
+            self._save_index(index)
+
+        return entry
+
+    def set_alias(self, alias, version):
+        """Point an alias at an existing version"""
+        with self.lock():
+            index = self.load_index()
+            if version not in index['versions']:
+                raise KeyError(f"Unknown model version: {version}")
+            if alias == 'latest' and not self._is_newest(index, version):
+                raise ValueError(f"Refusing to move 'latest' onto older version: {version}")
+            index['aliases'][alias] = version
+            self._save_index(index)
+        return self
+
+    def update_metadata(self, version, updates):
+        """Merge extra fields into a registered version's metadata"""
+        with self.lock():
+            index = self.load_index()
+            if version not in index['versions']:
+                raise KeyError(f"Unknown model version: {version}")
+            index['versions'][version]['metadata'].update(updates)
+            self._save_index(index)
+        return self
+
+    def new_version_id(self, timestamp=None):
+        """Unused version id for a training run (suffixed on same-second clashes)"""
+        base = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+        versions = self.load_index()['versions']
+        version, suffix = base, 2
+        while version in versions:
+            version = f'{base}_{suffix}'
+            suffix += 1
+        return version
+
+    @staticmethod
+    def _is_newest(index, version):
+        """Whether no registered version is newer than `version`"""
+        key = version_sort_key(version)
+        return all(version_sort_key(other) <= key for other in index['versions'])
+
+    def resolve(self, ref, index=None):
+        """Resolve an alias or version id to a version id"""
+        index = index or self.load_index()
+        if ref in index['aliases']:
+            return index['aliases'][ref]
+        if ref in index['versions']:
+            return ref
+        raise KeyError(f"Unknown model alias or version: {ref}")
+
+    def load(self, ref='latest'):
+        """
+        Load a model version by alias or version id
+
+        Returns:
+            dict: artifacts plus 'metadata' and 'version'
+        """
+        index = self.load_index()
+        entry = index['versions'][self.resolve(ref, index)]
+        loaded = {name: self.get_object(digest) for name, digest in entry['artifacts'].items()}
+        loaded['metadata'] = entry['metadata']
+        loaded['version'] = entry['version']
+        return loaded
+
+    def list_versions(self):
+        """All index entries, newest first"""
+        index = self.load_index()
+        return sorted(
+            index['versions'].values(),
+            key=lambda e: version_sort_key(e['version']),
+            reverse=True
+        )
+
+    def best_version(self, metric='test_accuracy'):
+        """Version with the highest value for a metadata metric"""
+        versions = [e for e in self.list_versions() if e['metadata'].get(metric) is not None]
+        if not versions:
+            return None
+        return max(versions, key=lambda e: e['metadata'][metric])
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def disk_usage(self):
+        """Total bytes used by stored objects"""
+        if not self.objects_dir.exists():
+            return 0
+        return sum(p.stat().st_size for p in self.objects_dir.glob('*.pkl.gz'))
+
+    def prune(self, keep_versions=DEFAULT_KEEP_VERSIONS, max_bytes=None):
+        """
+        Apply retention policy and delete unreferenced objects
+
+        Aliased versions are never removed. The oldest remaining versions
+        are dropped until at most `keep_versions` are left and, if given,
+        stored objects fit in `max_bytes`.
+
+        Returns:
+            list: Removed version ids
+        """
+        with self.lock():
+            index = self.load_index()
+            protected = set(index['aliases'].values())
+            removable = sorted(
+                (v for v in index['versions'] if v not in protected),
+                key=version_sort_key
+            )
+
+            def object_sizes():
+                sizes = {}
+                for entry in index['versions'].values():
+                    for digest in entry['artifacts'].values():
+                        path = self._object_path(digest)
+                        if digest not in sizes and path.exists():
+                            sizes[digest] = path.stat().st_size
+                return sizes
+
+            removed = []
+            while removable:
+                over_count = keep_versions is not None and len(index['versions']) > keep_versions
+                over_size = max_bytes is not None and sum(object_sizes().values()) > max_bytes
+                if not (over_count or over_size):
+                    break
+                version = removable.pop(0)
+                del index['versions'][version]
+                removed.append(version)
+
+            if removed:
+                self._save_index(index)
+            self._collect_garbage(index)
+
+        return removed
+
+    def _collect_garbage(self, index):
+        referenced = {
+            digest
+            for entry in index['versions'].values()
+            for digest in entry['artifacts'].values()
+        }
+        if not self.objects_dir.exists():
+            return
+        for path in self.objects_dir.glob('*.pkl.gz'):
+            digest = path.name[:-len('.pkl.gz')]
+            if digest not in referenced:
+                path.unlink()
+                self._object_cache.pop(digest, None)
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+    def import_legacy(self, models_dir=None, aliases=None):
+        """
+        Register the legacy *_latest.pkl / model_metadata_latest.json files
+
+        Args:
+            models_dir (Path): Directory holding the legacy files
+            aliases (iterable): Aliases to point at the imported version.
+                By default 'latest' and 'production' are only set when they
+                don't exist yet ('latest' never moves onto an older version).
+        """
+        models_dir = Path(models_dir) if models_dir else self.registry_dir.parent
+        artifacts = {}
+        for name, filename in (
+            ('model', 'prakriti_classifier_latest.pkl'),
+            ('label_encoder', 'label_encoder_latest.pkl'),
+            ('feature_encoders', 'feature_encoders_latest.pkl'),
+        ):
+            with open(models_dir / filename, 'rb') as f:
+                artifacts[name] = pickle.load(f)
+        with open(models_dir / 'model_metadata_latest.json', 'r') as f:
+            metadata = json.load(f)
+
+        version = datetime.fromisoformat(metadata['training_date']).strftime('%Y%m%d_%H%M%S')
+        with self.lock():
+            if aliases is None:
+                index = self.load_index()
+                aliases = [
+                    alias for alias in ('latest', 'production')
+                    if alias not in index['aliases']
+                    and (alias != 'latest' or self._is_newest(index, version))
+                ]
+            return self.register(version, artifacts, metadata, aliases=tuple(aliases))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the Prakriti model registry')
+    parser.add_argument('--registry-dir', default=None, help='Registry directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='List registered versions')
+
+    promote = subparsers.add_parser('promote', help='Point an alias at a version')
+    promote.add_argument('version')
+    promote.add_argument('--alias', default='production')
+
+    prune = subparsers.add_parser('prune', help='Apply retention policy')
+    prune.add_argument('--keep', type=int, default=DEFAULT_KEEP_VERSIONS)
+    prune.add_argument('--max-mb', type=float, default=None)
+
+    import_legacy = subparsers.add_parser('import-legacy', help='Register legacy *_latest artifacts')
+    import_legacy.add_argument(
+        '--alias', action='append', default=None,
+        help='Alias to point at the imported version (repeatable; default: '
+             'latest/production only if not already set)'
+    )
+
+    args = parser.parse_args()
+    registry = ModelRegistry(args.registry_dir)
+
+    if args.command == 'list':
+        aliases = {}
+        for alias, version in registry.load_index()['aliases'].items():
+            aliases.setdefault(version, []).append(alias)
+        for entry in registry.list_versions():
+            meta = entry['metadata']
+            latency = (meta.get('latency_ms') or {}).get('p50')
+            latency_str = f"{latency:.2f}ms" if latency is not None else '-'
+            tags = ', '.join(sorted(aliases.get(entry['version'], [])))
+            print(f"{entry['version']}  {meta.get('model_name', '?'):20s} "
+                  f"acc={meta.get('test_accuracy', 0):.4f}  p50={latency_str}  {tags}")
+        print(f"\nDisk usage: {registry.disk_usage() / 1e6:.2f} MB")
+    elif args.command == 'promote':
+        try:
+            registry.set_alias(args.alias, registry.resolve(args.version))
+        except (KeyError, ValueError) as e:
+            print(f"❌ {e.args[0]}", file=sys.stderr)
+            return 1
+        print(f"✅ {args.alias} → {registry.resolve(args.alias)}")
+    elif args.command == 'prune':
+        max_bytes = int(args.max_mb * 1e6) if args.max_mb is not None else None
+        removed = registry.prune(keep_versions=args.keep, max_bytes=max_bytes)
+        print(f"✅ Removed {len(removed)} version(s)")
+    elif args.command == 'import-legacy':
+        try:
+            entry = registry.import_legacy(aliases=args.alias)
+        except FileNotFoundError as e:
+            print(f"❌ Legacy model file not found: {e.filename}", file=sys.stderr)
+            return 1
+        except (KeyError, ValueError) as e:
+            print(f"❌ {e.args[0]}", file=sys.stderr)
+            return 1
+        tags = [a for a, v in registry.load_index()['aliases'].items() if v == entry['version']]
+        print(f"✅ Imported legacy model as version {entry['version']}"
+              f" (aliases: {', '.join(tags) or 'none'})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
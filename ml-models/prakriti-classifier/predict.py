@@ -15,31 +15,67 @@ if sys.platform == 'win32':
 
 import pickle
 import numpy as np
-import pandas as pd
+import os
 from pathlib import Path
 import json
 
+from model_registry import ModelRegistry
+from canonicalizer import CategoryCanonicalizer
+
 
 class PrakritiPredictor:
     """Load and use trained Prakriti classifier"""
     
-    def __init__(self, model_dir=None):
+    def __init__(self, model_dir=None, model_alias='latest'):
         if model_dir is None:
             # Use path relative to this script
             script_dir = Path(__file__).parent
             model_dir = script_dir / 'models'
         self.model_dir = Path(model_dir)
+        self.model_alias = model_alias
+        self.model_version = None
         self.model = None
         self.label_encoder = None
         self.feature_encoders = None
         self.metadata = None
         self.feature_names = None
+        self.canonicalizer = None
         
     def load_model(self, verbose=False):
-        """Load the latest trained model"""
+        """Load the model version pointed to by `model_alias`"""
         if verbose:
             print("[INFO] Loading trained model...", file=sys.stderr)
         
+        registry = ModelRegistry(self.model_dir / 'registry')
+        if registry.exists():
+            loaded = registry.load(self.model_alias)
+            self.model = loaded['model']
+            self.label_encoder = loaded['label_encoder']
+            self.feature_encoders = loaded['feature_encoders']
+            self.metadata = loaded['metadata']
+            self.model_version = loaded['version']
+            if verbose:
+                print(f"[SUCCESS] Model '{self.model_alias}' loaded from registry "
+                      f"(version {self.model_version})", file=sys.stderr)
+        else:
+            self._load_legacy_model(verbose)
+        
+        self.feature_names = self.metadata['feature_names']
+        
+        # Build canonicalization indexes from each feature's vocabulary
+        self.canonicalizer = CategoryCanonicalizer(self.feature_encoders)
+        
+        if verbose:
+            print(f"\n[MODEL INFO]", file=sys.stderr)
+            print(f"   Model: {self.metadata['model_name']}", file=sys.stderr)
+            print(f"   Accuracy: {self.metadata['test_accuracy']:.4f}", file=sys.stderr)
+            print(f"   Classes: {', '.join(self.metadata['dosha_classes'])}", file=sys.stderr)
+            print(f"   Features: {self.metadata['num_features']}", file=sys.stderr)
+        
+        return self
+    
+    def _load_legacy_model(self, verbose=False):
+        """Load pre-registry *_latest.pkl artifacts"""
         # Load model
         model_path = self.model_dir / 'prakriti_classifier_latest.pkl'
         with open(model_path, 'rb') as f:
@@ -65,51 +101,47 @@ class PrakritiPredictor:
         metadata_path = self.model_dir / 'model_metadata_latest.json'
         with open(metadata_path, 'r') as f:
             self.metadata = json.load(f)
-        self.feature_names = self.metadata['feature_names']
         if verbose:
             print(f"[SUCCESS] Metadata loaded", file=sys.stderr)
-            print(f"\n[MODEL INFO]", file=sys.stderr)
-            print(f"   Model: {self.metadata['model_name']}", file=sys.stderr)
-            print(f"   Accuracy: {self.metadata['test_accuracy']:.4f}", file=sys.stderr)
-            print(f"   Classes: {', '.join(self.metadata['dosha_classes'])}", file=sys.stderr)
-            print(f"   Features: {self.metadata['num_features']}", file=sys.stderr)
-        
-        return self
     
-    def preprocess_input(self, user_data):
+    def preprocess_input(self, user_data, return_matches=False):
         """
         Preprocess user input data
         
+        Raw answer strings are canonicalized against each feature's training
+        vocabulary (exact, normalized or fuzzy match) before encoding.
+        Matches are memoized on this predictor, so only callers that reuse
+        one instance benefit; the CLI below loads a fresh one per request.
+        
         Args:
             user_data (dict): Dictionary with feature names as keys
+            return_matches (bool): Also return the per-feature match report
             
         Returns:
             np.array: Encoded features ready for prediction
+            (and dict of match info per feature if return_matches=True)
         """
-        # Create dataframe with expected features
-        df = pd.DataFrame([user_data])
-        
-        # Ensure all expected features are present
+        encoded = []
+        matches = {}
         for feature in self.feature_names:
-            if feature not in df.columns:
-                df[feature] = 'Unknown'
-        
-        # Reorder columns to match training data
-        df = df[self.feature_names]
-        
-        # Encode features
-        encoded_data = df.copy()
-        for column in self.feature_names:
-            if column in self.feature_encoders:
-                le = self.feature_encoders[column]
-                # Handle unseen values
-                try:
-                    encoded_data[column] = le.transform(df[column].astype(str))
-                except ValueError:
-                    # If value not seen during training, use most common class
-                    encoded_data[column] = 0
+            if feature not in user_data:
+                # Missing features fall back to the first class
+                encoded.append(0)
+                matches[feature] = {
+                    'input': None, 'value': None, 'code': None,
+                    'match': 'missing', 'score': 0.0
+                }
+                continue
+            
+            match = self.canonicalizer.canonicalize(feature, user_data[feature])
+            # If value not seen during training, use the first class
+            encoded.append(match['code'] if match['code'] is not None else 0)
+            matches[feature] = match
         
-        return encoded_data.values
+        X = np.array([encoded])
+        if return_matches:
+            return X, matches
+        return X
     
     def predict(self, user_data):
         """
@@ -119,10 +151,11 @@ class PrakritiPredictor:
             user_data (dict): Dictionary with feature names as keys
             
         Returns:
-            dict: Prediction results with dosha and confidence
+            dict: Prediction results with dosha, confidence and the
+                canonicalization match (type and score) for every feature
         """
         # Preprocess input
-        X = self.preprocess_input(user_data)
+        X, feature_matches = self.preprocess_input(user_data, return_matches=True)
         
         # Get prediction
         prediction = self.model.predict(X)[0]
@@ -143,7 +176,16 @@ class PrakritiPredictor:
         return {
             'predicted_dosha': dosha,
             'confidence': confidence,
-            'all_scores': confidence_scores
+            'all_scores': confidence_scores,
+            'feature_matches': {
+                feature: {
+                    'input': match['input'],
+                    'value': match['value'],
+                    'match': match['match'],
+                    'score': match['score']
+                }
+                for feature, match in feature_matches.items()
+            }
         }
     
     def predict_from_text(self, text_description):
@@ -251,7 +293,9 @@ if __name__ == "__main__":
             features = json.loads(sys.argv[1])
             
             # Initialize predictor (verbose=False to not print to stdout)
-            predictor = PrakritiPredictor()
+            predictor = PrakritiPredictor(
+                model_alias=os.environ.get('PRAKRITI_MODEL_ALIAS', 'latest')
+            )
             predictor.load_model(verbose=False)
             
             # Make prediction
@@ -261,7 +305,8 @@ if __name__ == "__main__":
             output = {
                 'prediction': result['predicted_dosha'],
                 'confidence': result['confidence'],
-                'probabilities': result['all_scores']
+                'probabilities': result['all_scores'],
+                'feature_matches': result['feature_matches']
             }
             # Print ONLY the JSON output (no other text!)
             print(json.dumps(output))
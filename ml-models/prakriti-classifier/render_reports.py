@@ -0,0 +1,155 @@
+"""
+Prakriti Classifier - Report Rendering Script
+==============================================
+Render training visualizations (confusion matrix, feature importance and
+model comparison) from the evaluation report saved by train_model.py.
+
+Plotting libraries are only imported here, so training can publish models
+without waiting on chart drawing.
+
+Usage:
+    python render_reports.py                      # uses outputs/evaluation_report_latest.json
+    python render_reports.py path/to/report.json
+"""
+
+import sys
+import json
+from pathlib import Path
+
+
+DEFAULT_REPORT_PATH = Path(__file__).parent / 'outputs' / 'evaluation_report_latest.json'
+
+
+def load_report(report_path=None):
+    """Load a saved evaluation report"""
+    report_path = Path(report_path) if report_path else DEFAULT_REPORT_PATH
+    with open(report_path, 'r') as f:
+        return json.load(f)
+
+
+class ReportRenderer:
+    """Render training charts from saved evaluation metrics"""
+
+    def __init__(self, report, output_dir=None, dpi=300):
+        # Import lazily and force a non-interactive backend so rendering
+        # works in headless/background processes
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        self.plt = plt
+        self.sns = sns
+        self.report = report
+        self.dpi = dpi
+        if output_dir is None:
+            output_dir = Path(__file__).parent / 'outputs'
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def render_confusion_matrix(self):
+        """Render confusion matrix heatmap"""
+        plt, sns = self.plt, self.sns
+        target_names = self.report['dosha_classes']
+
+        plt.figure(figsize=(10, 8))
+        sns.heatmap(
+            self.report['confusion_matrix'],
+            annot=True,
+            fmt='d',
+            cmap='Blues',
+            xticklabels=target_names,
+            yticklabels=target_names
+        )
+        plt.title(f'Confusion Matrix - {self.report["model_name"]}', fontsize=16)
+        plt.ylabel('True Label', fontsize=12)
+        plt.xlabel('Predicted Label', fontsize=12)
+        plt.tight_layout()
+
+        output_path = self.output_dir / 'confusion_matrix.png'
+        plt.savefig(output_path, dpi=self.dpi)
+        print(f"✅ Confusion matrix saved to: {output_path}")
+        plt.close()
+
+        return self
+
+    def render_feature_importance(self):
+        """Render top 15 feature importances (if available)"""
+        feature_importance = self.report.get('feature_importance')
+        if not feature_importance:
+            return self
+
+        plt, sns = self.plt, self.sns
+        top_features = feature_importance[:15]
+
+        plt.figure(figsize=(12, 8))
+        sns.barplot(
+            x=[item['importance'] for item in top_features],
+            y=[item['feature'] for item in top_features],
+            palette='viridis'
+        )
+        plt.title('Top 15 Feature Importances', fontsize=16)
+        plt.xlabel('Importance Score', fontsize=12)
+        plt.ylabel('Features', fontsize=12)
+        plt.tight_layout()
+
+        output_path = self.output_dir / 'feature_importance.png'
+        plt.savefig(output_path, dpi=self.dpi)
+        print(f"✅ Feature importance plot saved to: {output_path}")
+        plt.close()
+
+        return self
+
+    def render_model_comparison(self):
+        """Render test accuracy / F1 comparison across all trained models"""
+        plt = self.plt
+        comparison = self.report['model_comparison']
+        best_model_name = self.report['model_name']
+
+        model_names = list(comparison.keys())
+        test_accuracies = [comparison[m]['test_accuracy'] for m in model_names]
+        f1_scores = [comparison[m]['f1_score'] for m in model_names]
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+        # Test Accuracy comparison
+        colors = ['#2ecc71' if m == best_model_name else '#3498db' for m in model_names]
+        ax1.barh(model_names, test_accuracies, color=colors)
+        ax1.set_xlabel('Test Accuracy', fontsize=12)
+        ax1.set_title('Model Comparison - Test Accuracy', fontsize=14)
+        ax1.set_xlim([0, 1])
+        for i, v in enumerate(test_accuracies):
+            ax1.text(v + 0.01, i, f'{v:.4f}', va='center')
+
+        # F1 Score comparison
+        ax2.barh(model_names, f1_scores, color=colors)
+        ax2.set_xlabel('F1 Score', fontsize=12)
+        ax2.set_title('Model Comparison - F1 Score', fontsize=14)
+        ax2.set_xlim([0, 1])
+        for i, v in enumerate(f1_scores):
+            ax2.text(v + 0.01, i, f'{v:.4f}', va='center')
+
+        plt.tight_layout()
+        output_path = self.output_dir / 'model_comparison.png'
+        plt.savefig(output_path, dpi=self.dpi)
+        print(f"✅ Model comparison saved to: {output_path}")
+        plt.close()
+
+        return self
+
+    def render_all(self):
+        """Render every available chart"""
+        return self.render_confusion_matrix() \
+                   .render_feature_importance() \
+                   .render_model_comparison()
+
+
+def render_reports(report_path=None, output_dir=None):
+    """Render all charts for a saved evaluation report"""
+    print("\n📊 Rendering training reports...")
+    report = load_report(report_path)
+    ReportRenderer(report, output_dir=output_dir).render_all()
+
+
+if __name__ == "__main__":
+    render_reports(sys.argv[1] if len(sys.argv) > 1 else None)
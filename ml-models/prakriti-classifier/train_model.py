@@ -6,18 +6,33 @@ from physical, physiological, and lifestyle attributes.
 
 Dataset: Updated_Prakriti_With_Features.csv (1200 entries, 30 features)
 Task: Multi-class classification
-Output: Trained model saved as .pkl file
+Output: Trained model registered in models/registry (see model_registry.py)
 """
 
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
 import pandas as pd
 import numpy as np
-import pickle
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
+from model_registry import ModelRegistry, DEFAULT_KEEP_VERSIONS, hash_file
+from cv_worker import fit_and_score_fold
+
 # Scikit-learn imports
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
+from sklearn.model_selection import (
+    train_test_split,
+    cross_val_score,
+    GridSearchCV,
+    RepeatedStratifiedKFold
+)
+from sklearn.base import clone
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
@@ -36,18 +51,41 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 
-# Visualization
-import matplotlib.pyplot as plt
-import seaborn as sns
+# Parallel cross-validation (joblib and scipy ship with scikit-learn)
+from concurrent.futures import wait, FIRST_COMPLETED
+import joblib
+from joblib import effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
+from scipy import stats
+
+# Visualization (matplotlib/seaborn) lives in render_reports.py and is only
+# imported when charts are rendered
 
 # Warnings
 import warnings
 warnings.filterwarnings('ignore')
 
-print("=" * 80)
-print("🌿 AYURAI - PRAKRITI CLASSIFIER TRAINING")
-print("=" * 80)
-print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+def _confidence_interval(scores, confidence=0.95):
+    """
+    Mean, std and t-distribution confidence interval of fold scores
+    
+    With fewer than 2 folds the spread is unknown, so std and the interval
+    are None rather than a zero-width interval.
+    """
+    scores = np.asarray(scores, dtype=float)
+    mean = float(scores.mean())
+    if len(scores) < 2:
+        return {'mean': mean, 'std': None, 'ci_low': None, 'ci_high': None}
+    
+    std = float(scores.std(ddof=1))
+    half_width = stats.t.ppf((1 + confidence) / 2, len(scores) - 1) * std / np.sqrt(len(scores))
+    return {
+        'mean': mean,
+        'std': std,
+        'ci_low': float(mean - half_width),
+        'ci_high': float(mean + half_width)
+    }
 
 
 class PrakritiClassifier:
@@ -71,11 +109,18 @@ class PrakritiClassifier:
         self.model = None
         self.best_model = None
         self.model_metrics = {}
+        self.evaluation_report = None
+        self.timestamp = None
+        self.evaluation_report_path = None
+        self.dataset_hash = None
+        self.latency_ms = None
+        self.cv_results = None
         
     def load_data(self):
         """Load and inspect the dataset"""
         print("📊 Loading dataset...")
         self.df = pd.read_csv(self.data_path)
+        self.dataset_hash = hash_file(self.data_path)
         
         print(f"✅ Dataset loaded successfully!")
         print(f"   Shape: {self.df.shape}")
@@ -149,14 +194,9 @@ class PrakritiClassifier:
         
         return self
     
-    def train_models(self):
-        """Train multiple models and compare performance"""
-        print("\n" + "=" * 80)
-        print("🤖 TRAINING MODELS")
-        print("=" * 80)
-        
-        # Define models to compare
-        models = {
+    def _candidate_models(self):
+        """Fresh, unfitted instances of every model to compare"""
+        return {
             'Random Forest': RandomForestClassifier(
                 n_estimators=200,
                 max_depth=20,
@@ -183,6 +223,177 @@ class PrakritiClassifier:
                 random_state=42
             )
         }
+    
+    def cross_validate_models(self, n_splits=5, n_repeats=1, n_jobs=-1,
+                              time_budget=None, confidence=0.95):
+        """
+        Repeated stratified k-fold evaluation of every candidate model on
+        the training split
+        
+        Fold arrays are built once, saved to a temporary file and
+        memory-mapped once per worker process (see cv_worker.py). (model, fold) tasks are submitted to a
+        process pool as workers free up. Each model's first fold runs as a
+        probe, and a later fold is only submitted if the estimated cost
+        (mean of that model's finished folds) still fits in `time_budget`
+        (seconds). When the deadline passes, in-flight tasks are killed and
+        the statistics come from the folds that finished.
+        
+        Args:
+            n_splits (int): Folds per repeat
+            n_repeats (int): Number of repeats with different shuffles
+            n_jobs (int): Parallel workers (-1 = all cores)
+            time_budget (float): Wall-clock budget in seconds (None = no limit)
+            confidence (float): Confidence level for the intervals
+        """
+        print("\n" + "=" * 80)
+        print("🔁 CROSS-VALIDATION")
+        print("=" * 80)
+        
+        start = time.perf_counter()
+        # Folds come from the training split only; X_test stays untouched
+        # for the final hold-out report
+        X = self.X_train.values
+        y = self.y_train
+        
+        # Build every fold's arrays exactly once
+        splitter = RepeatedStratifiedKFold(
+            n_splits=n_splits, n_repeats=n_repeats, random_state=42
+        )
+        folds = [
+            (X[train_idx], X[test_idx], y[train_idx], y[test_idx])
+            for train_idx, test_idx in splitter.split(X, y)
+        ]
+        
+        # Workers already run in parallel, so keep each model single-threaded
+        models = {}
+        for name, model in self._candidate_models().items():
+            if 'n_jobs' in model.get_params():
+                model.set_params(n_jobs=1)
+            models[name] = model
+        
+        n_workers = effective_n_jobs(n_jobs)
+        print(f"   {n_splits}-fold x {n_repeats} repeat(s), {len(models)} models, "
+              f"{n_workers} workers")
+        if time_budget is not None:
+            print(f"   Time budget: {time_budget:.0f}s")
+        
+        def remaining():
+            if time_budget is None:
+                return None
+            return time_budget - (time.perf_counter() - start)
+        
+        # Fold-major order so every model gets its probe fold first
+        queue = [(fold_id, name) for fold_id in range(len(folds)) for name in models]
+        durations = {name: [] for name in models}
+        fold_scores = []
+        pending = {}
+        deadline_hit = False
+        
+        cache_dir = tempfile.mkdtemp(prefix='prakriti-cv-')
+        folds_path = os.path.join(cache_dir, 'folds.joblib')
+        joblib.dump(folds, folds_path)
+        executor = get_reusable_executor(max_workers=n_workers)
+        try:
+            while queue or pending:
+                # Fill free workers with tasks whose estimated cost still fits
+                waiting = []
+                for fold_id, name in queue:
+                    if len(pending) >= n_workers:
+                        waiting.append((fold_id, name))
+                        continue
+                    if fold_id > 0 and not durations[name]:
+                        # Wait for this model's probe before committing more folds
+                        waiting.append((fold_id, name))
+                        continue
+                    estimate = np.mean(durations[name]) if durations[name] else 0.0
+                    time_left = remaining()
+                    if time_left is not None and estimate > time_left:
+                        continue
+                    future = executor.submit(
+                        fit_and_score_fold, name, clone(models[name]), fold_id, folds_path
+                    )
+                    pending[future] = (fold_id, name)
+                queue = waiting
+                
+                if not pending:
+                    break
+                
+                time_left = remaining()
+                if time_left is not None and time_left <= 0:
+                    deadline_hit = True
+                    break
+                done, _ = wait(pending, timeout=time_left, return_when=FIRST_COMPLETED)
+                if not done:
+                    deadline_hit = True
+                    break
+                for future in done:
+                    del pending[future]
+                    result = future.result()
+                    durations[result['model']].append(result['seconds'])
+                    fold_scores.append(result)
+        finally:
+            if pending:
+                # Deadline passed: abandon (and kill) in-flight fits
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=False, kill_workers=True)
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        
+        if deadline_hit or len(fold_scores) < len(folds) * len(models):
+            print(f"⏱️  Time budget reached after {len(fold_scores)} of "
+                  f"{len(folds) * len(models)} fold fits")
+        
+        completed_per_model = [
+            sum(1 for r in fold_scores if r['model'] == name) for name in models
+        ]
+        folds_completed = min(completed_per_model) if completed_per_model else 0
+        
+        elapsed = time.perf_counter() - start
+        
+        model_stats = {}
+        for name in models:
+            scores = [r for r in fold_scores if r['model'] == name]
+            if not scores:
+                continue
+            model_stats[name] = {
+                'n_folds': len(scores),
+                'accuracy': _confidence_interval([r['accuracy'] for r in scores], confidence),
+                'f1_score': _confidence_interval([r['f1_score'] for r in scores], confidence)
+            }
+            acc = model_stats[name]['accuracy']
+            if acc['ci_low'] is None:
+                print(f"   {name:20s} accuracy {acc['mean']:.4f} "
+                      f"(1 fold - no confidence interval)")
+            else:
+                print(f"   {name:20s} accuracy {acc['mean']:.4f} ± {acc['std']:.4f} "
+                      f"({confidence:.0%} CI {acc['ci_low']:.4f}-{acc['ci_high']:.4f}, "
+                      f"{len(scores)} folds)")
+        
+        self.cv_results = {
+            'n_splits': n_splits,
+            'n_repeats': n_repeats,
+            'n_samples': len(y),
+            'folds_total': len(folds),
+            'folds_completed': folds_completed,
+            'fits_completed': len(fold_scores),
+            'truncated': folds_completed < len(folds),
+            'confidence_level': confidence,
+            'time_budget_seconds': time_budget,
+            'elapsed_seconds': elapsed,
+            'models': model_stats
+        }
+        print(f"✅ Cross-validation finished in {elapsed:.1f}s "
+              f"({folds_completed}/{len(folds)} folds)")
+        
+        return self
+    
+    def train_models(self):
+        """Train multiple models and compare performance"""
+        print("\n" + "=" * 80)
+        print("🤖 TRAINING MODELS")
+        print("=" * 80)
+        
+        models = self._candidate_models()
         
         results = {}
         
@@ -216,8 +427,19 @@ class PrakritiClassifier:
             print(f"   ✅ Test Accuracy: {test_acc:.4f}")
             print(f"   ✅ F1 Score: {f1:.4f}")
         
-        # Select best model based on test accuracy
-        best_model_name = max(results, key=lambda x: results[x]['test_accuracy'])
+        # Select best model on cross-validated accuracy for models with at
+        # least 2 folds, hold-out test accuracy otherwise (and as tie-break)
+        cv_models = self.cv_results['models'] if self.cv_results else {}
+        
+        def selection_key(name):
+            cv_stats = cv_models.get(name)
+            if cv_stats and cv_stats['n_folds'] >= 2:
+                accuracy = cv_stats['accuracy']['mean']
+            else:
+                accuracy = results[name]['test_accuracy']
+            return (accuracy, results[name]['test_accuracy'])
+        
+        best_model_name = max(results, key=selection_key)
         self.best_model = results[best_model_name]['model']
         self.model_metrics = results[best_model_name]
         self.model_metrics['model_name'] = best_model_name
@@ -232,7 +454,7 @@ class PrakritiClassifier:
         return self
     
     def evaluate_model(self):
-        """Detailed evaluation of the best model"""
+        """Detailed evaluation of the best model (metrics only, no plotting)"""
         print("\n" + "=" * 80)
         print("📈 MODEL EVALUATION")
         print("=" * 80)
@@ -249,28 +471,22 @@ class PrakritiClassifier:
         cm = confusion_matrix(self.y_test, y_pred)
         print("\n🔢 Confusion Matrix:")
         print("-" * 80)
+        print(cm)
         
-        # Create confusion matrix visualization
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(
-            cm, 
-            annot=True, 
-            fmt='d', 
-            cmap='Blues',
-            xticklabels=target_names,
-            yticklabels=target_names
-        )
-        plt.title(f'Confusion Matrix - {self.model_metrics["model_name"]}', fontsize=16)
-        plt.ylabel('True Label', fontsize=12)
-        plt.xlabel('Predicted Label', fontsize=12)
-        plt.tight_layout()
-        
-        # Save confusion matrix
-        output_dir = Path(__file__).parent / 'outputs'
-        output_dir.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_dir / 'confusion_matrix.png', dpi=300)
-        print(f"✅ Confusion matrix saved to: {output_dir / 'confusion_matrix.png'}")
-        plt.close()
+        # Everything needed to render charts later, without the model
+        self.evaluation_report = {
+            'model_name': self.model_metrics['model_name'],
+            'dosha_classes': target_names.tolist(),
+            'confusion_matrix': cm.tolist(),
+            'feature_importance': None,
+            'model_comparison': {
+                name: {
+                    'test_accuracy': float(result['test_accuracy']),
+                    'f1_score': float(result['f1_score'])
+                }
+                for name, result in self.all_model_results.items()
+            }
+        }
         
         # Feature importance (if available)
         if hasattr(self.best_model, 'feature_importances_'):
@@ -284,69 +500,49 @@ class PrakritiClassifier:
             for idx, row in feature_importance.head(10).iterrows():
                 print(f"   {row['feature']}: {row['importance']:.4f}")
             
-            # Save feature importance plot
-            plt.figure(figsize=(12, 8))
-            sns.barplot(
-                data=feature_importance.head(15),
-                x='importance',
-                y='feature',
-                palette='viridis'
-            )
-            plt.title('Top 15 Feature Importances', fontsize=16)
-            plt.xlabel('Importance Score', fontsize=12)
-            plt.ylabel('Features', fontsize=12)
-            plt.tight_layout()
-            plt.savefig(output_dir / 'feature_importance.png', dpi=300)
-            print(f"✅ Feature importance plot saved to: {output_dir / 'feature_importance.png'}")
-            plt.close()
+            self.evaluation_report['feature_importance'] = [
+                {'feature': row['feature'], 'importance': float(row['importance'])}
+                for _, row in feature_importance.iterrows()
+            ]
         
         return self
     
-    def save_model(self):
-        """Save trained model and encoders"""
+    def benchmark_latency(self, runs=50):
+        """Measure single-sample and batch prediction latency of the best model"""
+        sample = self.X_test.iloc[[0]]
+        
+        # Warm up once so lazy initialisation isn't counted
+        self.best_model.predict(sample)
+        
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            self.best_model.predict(sample)
+            timings.append((time.perf_counter() - start) * 1000)
+        
+        start = time.perf_counter()
+        self.best_model.predict(self.X_test)
+        batch_ms = (time.perf_counter() - start) * 1000
+        
+        self.latency_ms = {
+            'p50': float(np.percentile(timings, 50)),
+            'p95': float(np.percentile(timings, 95)),
+            'batch_per_sample': batch_ms / len(self.X_test)
+        }
+        print(f"\n⏱️  Prediction latency: p50={self.latency_ms['p50']:.2f}ms, "
+              f"p95={self.latency_ms['p95']:.2f}ms")
+        
+        return self
+    
+    def save_model(self, keep_versions=DEFAULT_KEEP_VERSIONS, max_registry_bytes=None):
+        """Register trained model and encoders in the model registry"""
         print("\n" + "=" * 80)
         print("💾 SAVING MODEL")
         print("=" * 80)
         
-        output_dir = Path(__file__).parent / 'models'
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Save model
-        model_path = output_dir / f'prakriti_classifier_{timestamp}.pkl'
-        with open(model_path, 'wb') as f:
-            pickle.dump(self.best_model, f)
-        print(f"✅ Model saved: {model_path}")
-        
-        # Save label encoder
-        label_encoder_path = output_dir / f'label_encoder_{timestamp}.pkl'
-        with open(label_encoder_path, 'wb') as f:
-            pickle.dump(self.label_encoder, f)
-        print(f"✅ Label encoder saved: {label_encoder_path}")
-        
-        # Save feature encoders
-        feature_encoders_path = output_dir / f'feature_encoders_{timestamp}.pkl'
-        with open(feature_encoders_path, 'wb') as f:
-            pickle.dump(self.feature_encoders, f)
-        print(f"✅ Feature encoders saved: {feature_encoders_path}")
-        
-        # Save latest model (overwrite)
-        latest_model_path = output_dir / 'prakriti_classifier_latest.pkl'
-        with open(latest_model_path, 'wb') as f:
-            pickle.dump(self.best_model, f)
-        
-        latest_label_encoder_path = output_dir / 'label_encoder_latest.pkl'
-        with open(latest_label_encoder_path, 'wb') as f:
-            pickle.dump(self.label_encoder, f)
+        registry = ModelRegistry()
         
-        latest_feature_encoders_path = output_dir / 'feature_encoders_latest.pkl'
-        with open(latest_feature_encoders_path, 'wb') as f:
-            pickle.dump(self.feature_encoders, f)
-        
-        print(f"✅ Latest models also saved (no timestamp)")
-        
-        # Save model metadata
+        # Model metadata
         metadata = {
             'model_name': self.model_metrics['model_name'],
             'train_accuracy': float(self.model_metrics['train_accuracy']),
@@ -354,7 +550,10 @@ class PrakritiClassifier:
             'f1_score': float(self.model_metrics['f1_score']),
             'precision': float(self.model_metrics['precision']),
             'recall': float(self.model_metrics['recall']),
+            'latency_ms': None,
+            'cross_validation': self.cv_results,
             'training_date': datetime.now().isoformat(),
+            'dataset_hash': self.dataset_hash,
             'dataset_size': len(self.df),
             'train_size': len(self.X_train),
             'test_size': len(self.X_test),
@@ -363,60 +562,172 @@ class PrakritiClassifier:
             'feature_names': self.X_train.columns.tolist()
         }
         
-        metadata_path = output_dir / f'model_metadata_{timestamp}.json'
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        print(f"✅ Metadata saved: {metadata_path}")
+        # Pick the version id and register under one lock so concurrent
+        # trainings can't claim the same id
+        with registry.lock():
+            timestamp = registry.new_version_id()
+            entry = registry.register(
+                timestamp,
+                {
+                    'model': self.best_model,
+                    'label_encoder': self.label_encoder,
+                    'feature_encoders': self.feature_encoders
+                },
+                metadata,
+                aliases=('latest',)
+            )
+        self.timestamp = timestamp
+        print(f"✅ Model registered as version: {timestamp} (alias: latest)")
+        for name, digest in entry['artifacts'].items():
+            print(f"   {name}: {digest[:12]}")
         
-        # Also save as latest
-        latest_metadata_path = output_dir / 'model_metadata_latest.json'
-        with open(latest_metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # Benchmark after publishing so registration never waits on it
+        self.benchmark_latency()
+        registry.update_metadata(timestamp, {'latency_ms': self.latency_ms})
+        
+        # Apply retention policy
+        removed = registry.prune(keep_versions=keep_versions, max_bytes=max_registry_bytes)
+        if removed:
+            print(f"🧹 Pruned {len(removed)} old version(s)")
+        print(f"✅ Registry size: {registry.disk_usage() / 1e6:.2f} MB")
         
         return self
     
-    def create_model_comparison_plot(self):
-        """Create visualization comparing all models"""
-        print("\n📊 Creating model comparison plot...")
-        
+    def save_evaluation_report(self):
+        """
+        Save evaluation metrics so reports can be rendered separately
+        
+        Writes evaluation_report_latest.json and, when the model was
+        registered, a copy keyed by its registry version. Copies for
+        versions the registry has pruned are removed.
+        """
         output_dir = Path(__file__).parent / 'outputs'
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Prepare data for plotting
-        model_names = list(self.all_model_results.keys())
-        test_accuracies = [self.all_model_results[m]['test_accuracy'] for m in model_names]
-        f1_scores = [self.all_model_results[m]['f1_score'] for m in model_names]
-        
-        # Create comparison plot
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Test Accuracy comparison
-        colors = ['#2ecc71' if m == self.model_metrics['model_name'] else '#3498db' for m in model_names]
-        ax1.barh(model_names, test_accuracies, color=colors)
-        ax1.set_xlabel('Test Accuracy', fontsize=12)
-        ax1.set_title('Model Comparison - Test Accuracy', fontsize=14)
-        ax1.set_xlim([0, 1])
-        for i, v in enumerate(test_accuracies):
-            ax1.text(v + 0.01, i, f'{v:.4f}', va='center')
-        
-        # F1 Score comparison
-        ax2.barh(model_names, f1_scores, color=colors)
-        ax2.set_xlabel('F1 Score', fontsize=12)
-        ax2.set_title('Model Comparison - F1 Score', fontsize=14)
-        ax2.set_xlim([0, 1])
-        for i, v in enumerate(f1_scores):
-            ax2.text(v + 0.01, i, f'{v:.4f}', va='center')
-        
-        plt.tight_layout()
-        plt.savefig(output_dir / 'model_comparison.png', dpi=300)
-        print(f"✅ Model comparison saved to: {output_dir / 'model_comparison.png'}")
-        plt.close()
+        latest_report_path = output_dir / 'evaluation_report_latest.json'
+        with open(latest_report_path, 'w') as f:
+            json.dump(self.evaluation_report, f, indent=2)
+        self.evaluation_report_path = latest_report_path
+        
+        if self.timestamp is not None:
+            report_path = output_dir / f'evaluation_report_{self.timestamp}.json'
+            with open(report_path, 'w') as f:
+                json.dump(self.evaluation_report, f, indent=2)
+            self.evaluation_report_path = report_path
+            
+            # Apply the registry's retention to per-version reports
+            registered = ModelRegistry().load_index()['versions']
+            for path in output_dir.glob('evaluation_report_*.json'):
+                version = path.stem[len('evaluation_report_'):]
+                if version != 'latest' and version not in registered:
+                    path.unlink()
+        
+        print(f"✅ Evaluation report saved: {self.evaluation_report_path}")
+        return self
+    
+    def render_reports(self, mode='inline'):
+        """
+        Render charts from the saved evaluation report
+        
+        Args:
+            mode (str): 'inline' renders now, 'background' hands off to a
+                detached render_reports.py process, 'none' skips rendering
+        """
+        if mode == 'none':
+            print("\n⏭️  Headless mode: skipping report rendering")
+            print("   Render later with: python render_reports.py")
+            return self
+        
+        script_path = Path(__file__).parent / 'render_reports.py'
+        
+        if mode == 'background':
+            # Keep the detached process's output so failed renders leave a trace
+            log_path = Path(__file__).parent / 'outputs' / 'render_reports.log'
+            with open(log_path, 'w') as log_file:
+                subprocess.Popen(
+                    [sys.executable, str(script_path), str(self.evaluation_report_path)],
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True
+                )
+            print("\n📊 Report rendering started in background")
+            print(f"   Log: {log_path}")
+            return self
+        
+        from render_reports import ReportRenderer
+        ReportRenderer(self.evaluation_report).render_all()
         
         return self
 
 
+def parse_args():
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description='Train the Prakriti classifier')
+    report_mode = parser.add_mutually_exclusive_group()
+    report_mode.add_argument(
+        '--headless',
+        action='store_true',
+        help='Skip report rendering entirely (no plotting libraries are imported)'
+    )
+    report_mode.add_argument(
+        '--background-reports',
+        action='store_true',
+        help='Render reports in a background process after the model is saved'
+    )
+    parser.add_argument(
+        '--cv-folds',
+        type=int,
+        default=5,
+        help='Folds for cross-validated model comparison (0 disables cross-validation)'
+    )
+    parser.add_argument(
+        '--cv-repeats',
+        type=int,
+        default=1,
+        help='Repeats of stratified k-fold with different shuffles'
+    )
+    parser.add_argument(
+        '--cv-jobs',
+        type=int,
+        default=-1,
+        help='Parallel workers for cross-validation (-1 = all cores)'
+    )
+    parser.add_argument(
+        '--cv-budget',
+        type=float,
+        default=300,
+        help='Wall-clock budget for cross-validation in seconds'
+    )
+    parser.add_argument(
+        '--keep-versions',
+        type=int,
+        default=DEFAULT_KEEP_VERSIONS,
+        help='Number of model versions to retain in the registry (aliased versions are always kept)'
+    )
+    parser.add_argument(
+        '--max-registry-mb',
+        type=float,
+        default=None,
+        help='Prune old model versions until the registry fits in this many MB'
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main training pipeline"""
+    args = parse_args()
+    if args.headless:
+        report_mode = 'none'
+    elif args.background_reports:
+        report_mode = 'background'
+    else:
+        report_mode = 'inline'
+    max_registry_bytes = int(args.max_registry_mb * 1e6) if args.max_registry_mb is not None else None
+    
+    print("=" * 80)
+    print("🌿 AYURAI - PRAKRITI CLASSIFIER TRAINING")
+    print("=" * 80)
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     # Path to dataset
     data_path = '../../dataset/Updated_Prakriti_With_Features.csv'
@@ -424,13 +735,24 @@ def main():
     # Initialize classifier
     classifier = PrakritiClassifier(data_path)
     
-    # Run complete pipeline
-    classifier.load_data() \
-              .preprocess_data() \
-              .train_models() \
+    # Run complete pipeline - the model is published as soon as metrics
+    # are computed; charts are rendered from the saved report afterwards
+    classifier.load_data().preprocess_data()
+    
+    if args.cv_folds > 1:
+        classifier.cross_validate_models(
+            n_splits=args.cv_folds,
+            n_repeats=args.cv_repeats,
+            n_jobs=args.cv_jobs,
+            time_budget=args.cv_budget
+        )
+    
+    classifier.train_models() \
               .evaluate_model() \
-              .create_model_comparison_plot() \
-              .save_model()
+              .save_model(keep_versions=args.keep_versions,
+                          max_registry_bytes=max_registry_bytes) \
+              .save_evaluation_report() \
+              .render_reports(mode=report_mode)
     
     print("\n" + "=" * 80)
     print("✅ TRAINING COMPLETE!")
@@ -443,7 +765,7 @@ def main():
     print(f"   Recall: {classifier.model_metrics['recall']:.4f}")
     
     print(f"\n📁 Output Files:")
-    print(f"   Models: ml-models/prakriti-classifier/models/")
+    print(f"   Models: ml-models/prakriti-classifier/models/registry/")
     print(f"   Visualizations: ml-models/prakriti-classifier/outputs/")
     
     print(f"\n🌿 Ready for deployment!")